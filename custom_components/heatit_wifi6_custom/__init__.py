@@ -1,10 +1,12 @@
 import logging
-import asyncio
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.const import CONF_HOST
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_HOST, CONF_NAME
 from .const import DOMAIN
+from .api import HeatitWiFi6API, TLS_CHECK
+from .coordinator import HeatitWiFi6Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,17 +15,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    # Stagger device connection on startup to avoid all devices connecting at the same time.
-    entries = hass.config_entries.async_entries(DOMAIN)
-    try:
-        index = [e.entry_id for e in entries].index(entry.entry_id)
-    except ValueError:
-        index = 0  # fallback if not found; should never happen
-    wait_seconds = index * 2 + 2  # Always wait at least 2 seconds for the first, 4s for the second, etc.
-    if wait_seconds:
-        _LOGGER.info("Waiting %s seconds before connecting Heatit device for host: %s", wait_seconds, str(entry.data[CONF_HOST]))
-        await asyncio.sleep(wait_seconds)
     _LOGGER.info("Heatit async_setup_entry() called for host: %s", str(entry.data[CONF_HOST]))
+    # All devices share the pooled aiohttp session of Home Assistant.
+    api = HeatitWiFi6API(entry.data[CONF_HOST], async_get_clientsession(hass, verify_ssl=TLS_CHECK))
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = HeatitWiFi6Coordinator(hass, api, entry.data[CONF_NAME])
     await hass.config_entries.async_forward_entry_setups(entry, ["climate"])
     return True
 
@@ -1,8 +1,14 @@
 import aiohttp
 import logging
-import json
 import asyncio
-from .const import API_STATUS, API_PARAMETERS, API_RESET
+import random
+import time
+from .const import API_STATUS, API_PARAMETERS, API_RESET, POLL_INTERVAL
+
+try:  # orjson is shipped with Home Assistant, plain json is a fallback.
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -10,9 +16,38 @@ _LOGGER = logging.getLogger(__name__)
 # if certificate not verified, https works also with self signed certs.
 TLS_CHECK = True
 
+# retry backoff of _get(): full jitter, random delay between 0 and min(cap, base * 2^attempt) seconds.
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP_TIMEOUT = 30.0  # device did not answer in time, give it longer to recover
+RETRY_BACKOFF_CAP_ERROR = 10.0    # connection refused, dns failure etc.
+
+# get_status() returns the previous response if it is younger than this (seconds).
+STATUS_CACHE_TTL = 2.0
+
+# circuit breaker of get_status(): after this many failed polls in a row the device is not
+# contacted for BREAKER_OPEN_SECONDS, then one probe request decides whether to close or reopen.
+# The pause spans several poll intervals, so it skips scheduled polls regardless of their exact timing.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_OPEN_SECONDS = 3 * POLL_INTERVAL * 60
+
+# endpoint paths without trailing slash, resolved once at import.
+_STATUS_EP = API_STATUS.rstrip("/")
+_PARAMS_EP = API_PARAMETERS.rstrip("/")
+_RESET_EP = API_RESET.rstrip("/")
+
 class HeatitWiFi6API:
-    def __init__(self, host):
+    def __init__(self, host, session: aiohttp.ClientSession):
         self.__host = host.rstrip("/")
+        self._session = session  # shared session of Home Assistant, closed by Home Assistant
+        self._status_cache: tuple[float, dict] | None = None  # (monotonic time, status)
+        self._write_count = 0  # successful parameter writes and resets, a status fetched across a write is stale
+        self._status_inflight: asyncio.Task | None = None  # pending get_status() request shared by concurrent callers
+        self._fail_streak = 0     # consecutive failed get_status() requests
+        self._open_until = 0.0    # monotonic time until get_status() is short-circuited
+
+    @property
+    def write_count(self) -> int:
+        return self._write_count
 
     async def _get(self, endpoint, timeout=5, retries=0):  # simple general http-get with optional retries
         url = f"{self.__host}{endpoint}"
@@ -20,24 +55,23 @@ class HeatitWiFi6API:
 
         for attempt in range(retries + 1):
             try:
-                async with aiohttp.TCPConnector(ssl=TLS_CHECK, resolver=aiohttp.resolver.ThreadedResolver()) as conn:
-                    async with aiohttp.ClientSession(connector=conn, trust_env=False) as session:
-                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-                            text = await response.text()
-                            _LOGGER.debug(f"Response (get %s) data:\n%s", url, str(text))
-                            return await self._parse_json(text)
+                async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    body = await response.read()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Response (get %s) data:\n%s", url, body.decode(errors="replace"))
+                    return await self._parse_json(body)
             except asyncio.TimeoutError:
                 if attempt < retries:
-                    wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s...
-                    _LOGGER.debug("GET %s timed out (attempt %d/%d). Retrying in %d seconds...", url, attempt + 1, retries + 1, wait_time)
+                    wait_time = random.uniform(0, min(RETRY_BACKOFF_CAP_TIMEOUT, RETRY_BACKOFF_BASE * (2 ** attempt)))
+                    _LOGGER.debug("GET %s timed out (attempt %d/%d). Retrying in %.1f seconds...", url, attempt + 1, retries + 1, wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     _LOGGER.debug("GET %s failed after %d attempts: Timeout (device may be slow to respond)", url, retries + 1)
                     return {}
             except Exception as e:
                 if attempt < retries:
-                    wait_time = (attempt + 1) * 2
-                    _LOGGER.debug("GET %s failed (attempt %d/%d): %s. Retrying in %d seconds...", url, attempt + 1, retries + 1, str(e), wait_time)
+                    wait_time = random.uniform(0, min(RETRY_BACKOFF_CAP_ERROR, RETRY_BACKOFF_BASE * (2 ** attempt)))
+                    _LOGGER.debug("GET %s failed (attempt %d/%d): %s. Retrying in %.1f seconds...", url, attempt + 1, retries + 1, str(e), wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     _LOGGER.debug("GET %s failed after %d attempts: %s (device may be slow to respond)", url, retries + 1, str(e))
@@ -50,12 +84,11 @@ class HeatitWiFi6API:
         _LOGGER.debug("aiohttp - Post url: %s", url)
 
         try:
-            async with aiohttp.TCPConnector(ssl=TLS_CHECK, resolver=aiohttp.resolver.ThreadedResolver()) as conn:
-                async with aiohttp.ClientSession(connector=conn, trust_env=False) as session:
-                    async with session.post(url, json=data, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-                        text = await response.text()
-                        _LOGGER.debug(f"Response (post %s) data:\n%s", url, str(text))
-                        return await self._parse_json(text)
+            async with self._session.post(url, json=data, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                body = await response.read()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Response (post %s) data:\n%s", url, body.decode(errors="replace"))
+                return await self._parse_json(body)
         except Exception as e:
             _LOGGER.error("POST %s failed: %s", url, str(e))
             return {}
@@ -66,26 +99,28 @@ class HeatitWiFi6API:
         _LOGGER.debug("aiohttp - Delete url: %s", url)
 
         try:
-            async with aiohttp.TCPConnector(ssl=TLS_CHECK, resolver=aiohttp.resolver.ThreadedResolver()) as conn:
-                async with aiohttp.ClientSession(connector=conn, trust_env=False) as session:
-                    async with session.delete(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-                        text = await response.text()
-                        _LOGGER.debug(f"Response (delete %s) data:\n%s", url, str(text))
-                        return await self._parse_json(text)
+            async with self._session.delete(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                body = await response.read()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Response (delete %s) data:\n%s", url, body.decode(errors="replace"))
+                return await self._parse_json(body)
         except Exception as e:
             _LOGGER.error("DELETE %s failed: %s", url, str(e))
             return {}
 
 
     # aiohttp response.json() require a correct content-type header on the http response.
-    # parse json from response.text() is immune of content-type header.
-    async def _parse_json(self, text):
-       if not isinstance(text, str): return {}  # non string?
-       text = text.strip()
-       if not bool(text) or not text.startswith("{") or not text.endswith("}"): return {}  # not empty string and look like a json string?
+    # parse json from the raw response body is immune of content-type header and skips the utf-8 decode.
+    async def _parse_json(self, body):
+       if isinstance(body, bytes): start, end = b"{", b"}"
+       elif isinstance(body, str): start, end = "{", "}"
+       else: return {}  # non string?
+       if body[:1] != start or body[-1:] != end:  # strip only when the body is not a bare json object already
+           body = body.strip()
+           if body[:1] != start or body[-1:] != end: return {}  # not empty and look like a json object?
        try:
-           data = json.loads(text)
-       except json.JSONDecodeError as e:
+           data = _json.loads(body)
+       except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
            data = {}
            _LOGGER.error("Json parsing failed. %s ", str(e))
        return data
@@ -94,7 +129,7 @@ class HeatitWiFi6API:
     async def get_device_id(self, retries=0, timeout=8) -> str:
         """Get device ID with retry logic for slow WiFi connections during startup."""
         _LOGGER.debug("get_device_id() - Fetch device_id from the API (timeout=%ds, retries=%d)..", timeout, retries)
-        data = await self._get(API_STATUS.rstrip("/"), timeout=timeout, retries=retries)
+        data = await self._get(_STATUS_EP, timeout=timeout, retries=retries)
         device_id = data.get("id", "unknown")
         if device_id == "unknown":
             _LOGGER.debug("get_device_id() - Could not retrieve device ID (device may be slow to respond, will retry via polling)")
@@ -103,21 +138,60 @@ class HeatitWiFi6API:
 
     async def get_status(self, retries=1, timeout=5) -> dict:
         """Get status with optional retry logic. Default: 1 retry with 5s timeout for normal polling."""
-        _LOGGER.debug("get_status() - Fetch full status from the API (timeout=%ds, retries=%d)..", timeout, retries)
-        return await self._get(API_STATUS.rstrip("/"), timeout=timeout, retries=retries)
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < STATUS_CACHE_TTL:
+            _LOGGER.debug("get_status() - Return cached status (age %.1fs)", now - self._status_cache[0])
+            return self._status_cache[1]
+        if now < self._open_until:
+            _LOGGER.debug("get_status() - Device unreachable, next attempt in %.0fs", self._open_until - now)
+            return {}
+        if self._status_inflight is None:
+            _LOGGER.debug("get_status() - Fetch full status from the API (timeout=%ds, retries=%d)..", timeout, retries)
+            self._status_inflight = asyncio.get_running_loop().create_task(self._fetch_status(retries, timeout))
+        else:
+            _LOGGER.debug("get_status() - Wait for the status request already in progress..")
+        # The request runs in its own task, so a cancelled caller does not fail the other waiting callers.
+        return await asyncio.shield(self._status_inflight)
+
+
+    async def _fetch_status(self, retries, timeout) -> dict:
+        write_count = self._write_count
+        try:
+            data = await self._get(_STATUS_EP, timeout=timeout, retries=retries)
+            if data:
+                if write_count == self._write_count:  # don't cache a status read before a write
+                    self._status_cache = (time.monotonic(), data)
+                self._fail_streak = 0
+            else:
+                self._fail_streak += 1
+                if self._fail_streak >= BREAKER_FAILURE_THRESHOLD:
+                    _LOGGER.info("get_status() - %d failed requests in a row, pausing polling of %s for %ds",
+                                 self._fail_streak, self.__host, BREAKER_OPEN_SECONDS)
+                    self._open_until = time.monotonic() + BREAKER_OPEN_SECONDS
+            return data
+        finally:
+            if self._status_inflight is asyncio.current_task():  # a write may have detached it already
+                self._status_inflight = None
+
+
+    def _status_changed(self):  # after a successful write the cached and the in-progress status are outdated
+        self._write_count += 1
+        self._status_cache = None
+        self._status_inflight = None  # later callers start a new request, current waiters still get the old one
 
 
     async def set_parameter(self, parameter, value) -> dict:
         _LOGGER.info("set_parameter(%s, %s) - Set parameter to the thermostat..", parameter, value)
 
         data = {parameter: value}
-        response = await self._post(API_PARAMETERS.rstrip("/"), data)
+        response = await self._post(_PARAMS_EP, data)
 
         if response and response.get("status", "Failed") == "Success":
-            _LOGGER.debug(f"set_parameter({parameter, value}): {response.get("value", "Success, but no value of response: %s")}", str(response))
+            self._status_changed()
+            _LOGGER.debug("set_parameter(%s, %s): %s", parameter, value, response.get("value", "Success, but no value of response."))
             return response
         
-        _LOGGER.error("set_parameter({parameter, value}): %s", str(response))
+        _LOGGER.error("set_parameter(%s, %s): %s", parameter, value, response)
         return {}
 
 
@@ -128,11 +202,12 @@ class HeatitWiFi6API:
             _LOGGER.error("Unknown reset_type: %s", reset_type)
             return { "status": "Failed", "detail": "Unknown reset_type." }
         
-        response = await self._delete(f"{API_RESET.rstrip("/")}/{reset_type}")
+        response = await self._delete(f"{_RESET_EP}/{reset_type}")
 
         if response and response.get("status", "Failed") == "Success":
-            _LOGGER.info(f"reset_device({reset_type}): {response.get("value", "Success, but no value of response. (?)")}")
+            self._status_changed()
+            _LOGGER.info("reset_device(%s): %s", reset_type, response.get("value", "Success, but no value of response. (?)"))
             return response
         
-        _LOGGER.error("reset_device({reset_type}): %s", str(response))
+        _LOGGER.error("reset_device(%s): %s", reset_type, response)
         return {}
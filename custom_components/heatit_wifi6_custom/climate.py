@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import random
+from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.climate import ClimateEntity
@@ -11,15 +13,77 @@ from homeassistant.components.climate.const import (
     PRESET_NONE,
 )
 from homeassistant.const import UnitOfTemperature, CONF_HOST, CONF_NAME
-from datetime import timedelta
-from .const import SENSORMODES, SENSORVALUES, POLL_INTERVAL
-from .api import HeatitWiFi6API
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from .const import DOMAIN, SENSORMODES, SENSORVALUES
 from .exceptions import CannotConnect
 
 PARAM_HEATING_NAME = "heatingSetpoint"
 PARAM_COOLING_NAME = "coolingSetpoint"
 errors = {}
 
+# Entity state attribute name -> key in the /api/status response, grouped by the dict holding the key.
+# top level of the status
+_STATUS_FIELDS = (
+    ("info_currentPower", "currentPower"),
+    ("info_totalConsumption", "totalConsumption"),
+    ("info_internalTemperature", "internalTemperature"),
+    ("info_externalTemperature", "externalTemperature"),
+    ("info_floorTemperature", "floorTemperature"),
+    ("hw_firmware", "firmware"),
+)
+# status["parameters"]
+_PARAM_FIELDS = (
+    ("operating_mode", "operatingMode"),
+    ("param_sensorMode", "sensorMode"),
+    ("param_sensorValue", "sensorValue"),
+    ("param_heatingSetpoint", "heatingSetpoint"),
+    ("param_coolingSetpoint", "coolingSetpoint"),
+    ("param_ecoSetpoint", "ecoSetpoint"),
+    ("param_internalMinimumTemperatureLimit", "internalMinimumTemperatureLimit"),
+    ("param_internalMaximumTemperatureLimit", "internalMaximumTemperatureLimit"),
+    ("param_floorMinimumTemperatureLimit", "floorMinimumTemperatureLimit"),
+    ("param_floorMaximumTemperatureLimit", "floorMaximumTemperatureLimit"),
+    ("param_externalMinimumTemperatureLimit", "externalMinimumTemperatureLimit"),
+    ("param_externalMaximumTemperatureLimit", "externalMaximumTemperatureLimit"),
+    ("param_internalCalibration", "internalCalibration"),
+    ("param_floorCalibration", "floorCalibration"),
+    ("param_externalCalibration", "externalCalibration"),
+    ("param_regulationMode", "regulationMode"),
+    ("param_temperatureControlHysteresis", "temperatureControlHysteresis"),
+    ("param_temperatureDisplay", "temperatureDisplay"),
+    ("param_activeDisplayBrightness", "activeDisplayBrightness"),
+    ("param_standbyDisplayBrightness", "standbyDisplayBrightness"),
+    ("param_actionAfterError", "actionAfterError"),
+    ("param_powerRegulatorActiveTime", "powerRegulatorActiveTime"),
+    ("param_sizeOfLoad", "sizeOfLoad"),
+    ("param_disableButtons", "disableButtons"),
+)
+# status["parameters"]["OWD"]
+_OWD_FIELDS = (
+    ("owd_openWindowDetection", "openWindowDetection"),
+    ("owd_activeNow", "activeNow"),
+)
+# status["network"]
+_NETWORK_FIELDS = (
+    ("net_ssid", "SSID"),
+    ("net_mac", "mac"),
+    ("net_ipAddress", "ipAddress"),
+    ("net_wifiSignalStrength", "wifiSignalStrength"),
+    ("net_status", "status"),
+)
+
+# Heatit operatingMode: 0 = Off, 1 = Heat, 2 = Cool, 3 = Eco (Heat but using Eco setpoint)
+_HVAC_TO_OP = {HVACMode.OFF: 0, HVACMode.HEAT: 1, HVACMode.COOL: 2}
+_OP_TO_HVAC = {0: HVACMode.OFF, 1: HVACMode.HEAT, 2: HVACMode.COOL, 3: HVACMode.HEAT}
+# "Idle" depends on the current hvac mode and is handled in _heatit_state_to_hvac_action().
+_STATE_TO_ACTION = {"Heating": HVACAction.HEATING, "Cooling": HVACAction.COOLING}
+# Setpoint parameter used by each operatingMode, and its field in the entity state.
+_MODE_TO_SETPOINT_PARAM = {1: PARAM_HEATING_NAME, 2: PARAM_COOLING_NAME, 3: "ecoSetpoint"}
+_MODE_TO_SETPOINT_FIELD = {mode: f"param_{param}" for mode, param in _MODE_TO_SETPOINT_PARAM.items()}
+# Target temperatures are not overwritten by polling while a new value is being sent to the device.
+_SETPOINT_FIELDS = tuple(_MODE_TO_SETPOINT_FIELD.values())
+
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -30,8 +94,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
         host = entry.data[CONF_HOST]
         _LOGGER.info("Heatit WiFi6 async_setup_entry() name: %s, host: %s", name, host)
 
-        api = HeatitWiFi6API(host)
-        # Use shorter timeout and fewer retries for faster startup - device will connect via polling if needed
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        api = coordinator.api
+        # No retries for faster startup - device will connect via polling if needed.
+        # The timeout stays long enough for a slow device, the unique_id is derived from the device id.
         device_id = await api.get_device_id(retries=0, timeout=8)
         _LOGGER.debug("Name: %s, device_id: %s", name, device_id)
         
@@ -41,10 +107,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
                 "Device may be slow to respond or offline. Will retry during polling.",
                 name, host
             )
-            # Still create entity - it will retry during async_update
+            # Still create entity - the coordinator polling will retry
             device_id = f"unknown_{host.replace('.', '_')}"
         
-        entity = HeatitWiFi6Thermostat(hass, entry, api, name, device_id)
+        entity = HeatitWiFi6Thermostat(coordinator, entry, name, device_id)
         # Don't update before add - let polling handle initial connection to speed up startup
         async_add_entities([entity], False)
         _LOGGER.info("Heatit WiFi6 %s has been added to the list of entities.", name)
@@ -57,16 +123,14 @@ async def async_setup_entry(hass, entry, async_add_entities):
         )
         return False
 
-class HeatitWiFi6Thermostat(ClimateEntity):
+class HeatitWiFi6Thermostat(CoordinatorEntity, ClimateEntity):
     attr_has_entity_name = True
-    should_poll = False
-    SCAN_INTERVAL = timedelta(minutes=POLL_INTERVAL)
 
-    def __init__(self, hass, entry, api, name, device_id):
+    def __init__(self, coordinator, entry, name, device_id):
         _LOGGER.debug("HeatitWiFi6Thermostat::__init__(): %s", name)
-        self.hass = hass
+        super().__init__(coordinator)
         self.entry = entry
-        self._api = api
+        self._api = coordinator.api
         self._name = name
         self._device_id = device_id
 
@@ -75,43 +139,13 @@ class HeatitWiFi6Thermostat(ClimateEntity):
         self._temperature = None
         self._set_temperature_pending = False
 
-        self._info_currentPower = None
-        self._info_totalConsumption = None
-        self._info_internalTemperature = None
-        self._info_externalTemperature = None
-        self._info_floorTemperature = None
-        self._param_sensorMode = None
-        self._param_sensorValue = None
-        self._param_heatingSetpoint = None
-        self._param_coolingSetpoint = None
-        self._param_ecoSetpoint = None
-        self._param_internalMinimumTemperatureLimit = None
-        self._param_internalMaximumTemperatureLimit = None
-        self._param_floorMinimumTemperatureLimit = None
-        self._param_floorMaximumTemperatureLimit = None
-        self._param_externalMinimumTemperatureLimit = None
-        self._param_externalMaximumTemperatureLimit = None
-        self._param_internalCalibration = None
-        self._param_floorCalibration = None
-        self._param_externalCalibration = None
-        self._param_regulationMode = None
-        self._param_temperatureControlHysteresis = None
-        self._param_temperatureDisplay = None
-        self._param_activeDisplayBrightness = None
-        self._param_standbyDisplayBrightness = None
-        self._param_actionAfterError = None
-        self._param_powerRegulatorActiveTime = None
-        self._param_operatingMode = None
-        self._param_sizeOfLoad = None
-        self._param_disableButtons = None
-        self._owd_openWindowDetection = None
-        self._owd_activeNow = None
-        self._net_ssid = None
-        self._net_mac = None
-        self._net_ipAddress = None
-        self._net_wifiSignalStrength = None
-        self._net_status = None
-        self._hw_firmware = None
+        self._state: dict[str, Any] = {
+            field: None
+            for fields in (_STATUS_FIELDS, _PARAM_FIELDS, _OWD_FIELDS, _NETWORK_FIELDS)
+            for field, _ in fields
+        }
+        self._attrs: dict[str, Any] = {}
+        self._build_attributes()
 
         self._available = True
 
@@ -119,137 +153,59 @@ class HeatitWiFi6Thermostat(ClimateEntity):
         self._preset_mode = PRESET_NONE
 
     async def async_added_to_hass(self):
-        # Try initial update with retry logic, but don't fail if device is slow to respond
-        # Polling will handle subsequent updates
-        try:
-            await self.async_update()
-        except Exception as e:
-            _LOGGER.debug(
-                "Initial update failed for %s (device may be slow to respond): %s. Polling will retry.",
-                self.name, str(e)
-            )
-        self.should_poll = True
+        await super().async_added_to_hass()
+        # Initial refresh runs in the background, so a slow or offline device does not hold up the setup.
+        # The coordinator polling will handle subsequent updates
+        self.entry.async_create_background_task(
+            self.hass, self._async_first_refresh(), f"heatit_wifi6 first refresh {self._name}"
+        )
         _LOGGER.info(
             "async_added_to_hass(): Heatit WiFi6 integration is ready and polling enabled."
         )
 
-    async def async_update(self):
-        # Use retry logic for first update attempts, normal timeout for regular polling
-        data = await self._api.get_status(retries=1, timeout=5)
+    async def _async_first_refresh(self):
+        # Random delay spreads the first requests of concurrently set up devices.
+        await asyncio.sleep(random.uniform(0, 2))
+        await self.coordinator.async_refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data if self.coordinator.last_update_success else None
         if data:
             self._available = True
-            match data.get("parameters", {}).get("sensorMode", None):
+            state = self._state
+            params = data.get("parameters") or {}
+            owd = params.get("OWD") or {}
+            net = data.get("network") or {}
+            pending = {field: state[field] for field in _SETPOINT_FIELDS} if self._set_temperature_pending else None
+            for field, key in _STATUS_FIELDS:
+                state[field] = data.get(key)
+            for field, key in _PARAM_FIELDS:
+                state[field] = params.get(key)
+            for field, key in _OWD_FIELDS:
+                state[field] = owd.get(key)
+            for field, key in _NETWORK_FIELDS:
+                state[field] = net.get(key)
+            if pending:
+                state.update(pending)
+            match self._state["param_sensorMode"]:
                 case 0:
-                    self._temperature = data.get("floorTemperature", None)
+                    self._temperature = self._state["info_floorTemperature"]
                 case 3 | 4:
-                    self._temperature = data.get("externalTemperature", None)
+                    self._temperature = self._state["info_externalTemperature"]
                 case _:
-                    self._temperature = data.get("internalTemperature", None)
-            self._param_operatingMode = data.get("parameters").get("operatingMode")
+                    self._temperature = self._state["info_internalTemperature"]
             # Set preset mode according to operating mode: 3 = ECO, 1 = None
-            if self._param_operatingMode == 3:
+            if self._state["operating_mode"] == 3:
                 self._preset_mode = PRESET_ECO
-            elif self._param_operatingMode == 1:
-                self._preset_mode = PRESET_NONE
             else:
                 self._preset_mode = PRESET_NONE
-            self._hvac_mode = await self._heatit_operatingmode_to_hvac_mode(
-                self._param_operatingMode
+            self._hvac_mode = self._heatit_operatingmode_to_hvac_mode(
+                self._state["operating_mode"]
             )
-            self._hvac_action = await self._heatit_state_to_hvac_action(
+            self._hvac_action = self._heatit_state_to_hvac_action(
                 data.get("state")
             )  # _hvac_mode must be set before _hvac_action.
-            if not self._set_temperature_pending:
-                self._param_coolingSetpoint = data.get("parameters", {}).get(
-                    "coolingSetpoint", None
-                )
-                self._param_heatingSetpoint = data.get("parameters", {}).get(
-                    "heatingSetpoint", None
-                )
-                self._param_ecoSetpoint = data.get("parameters", {}).get(
-                    "ecoSetpoint", None
-                )
-
-            self._info_currentPower = data.get("currentPower", None)
-            self._info_totalConsumption = data.get("totalConsumption", None)
-            self._info_internalTemperature = data.get("internalTemperature", None)
-            self._info_externalTemperature = data.get("externalTemperature", None)
-            self._info_floorTemperature = data.get("floorTemperature", None)
-
-            self._param_sensorMode = data.get("parameters", {}).get("sensorMode", None)
-            self._param_sensorValue = data.get("parameters", {}).get(
-                "sensorValue", None
-            )
-            self._param_internalMinimumTemperatureLimit = data.get(
-                "parameters", {}
-            ).get("internalMinimumTemperatureLimit", None)
-            self._param_internalMaximumTemperatureLimit = data.get(
-                "parameters", {}
-            ).get("internalMaximumTemperatureLimit", None)
-            self._param_floorMinimumTemperatureLimit = data.get(
-                "parameters", {}
-            ).get("floorMinimumTemperatureLimit", None)
-            self._param_floorMaximumTemperatureLimit = data.get(
-                "parameters", {}
-            ).get("floorMaximumTemperatureLimit", None)
-            self._param_externalMinimumTemperatureLimit = data.get(
-                "parameters", {}
-            ).get("externalMinimumTemperatureLimit", None)
-            self._param_externalMaximumTemperatureLimit = data.get(
-                "parameters", {}
-            ).get("externalMaximumTemperatureLimit", None)
-            self._param_internalCalibration = data.get("parameters", {}).get(
-                "internalCalibration", None
-            )
-            self._param_floorCalibration = data.get("parameters", {}).get(
-                "floorCalibration", None
-            )
-            self._param_externalCalibration = data.get("parameters", {}).get(
-                "externalCalibration", None
-            )
-            self._param_regulationMode = data.get("parameters", {}).get(
-                "regulationMode", None
-            )
-            self._param_temperatureControlHysteresis = data.get(
-                "parameters", {}
-            ).get("temperatureControlHysteresis", None)
-            self._param_temperatureDisplay = data.get("parameters", {}).get(
-                "temperatureDisplay", None
-            )
-            self._param_activeDisplayBrightness = data.get("parameters", {}).get(
-                "activeDisplayBrightness", None
-            )
-            self._param_standbyDisplayBrightness = data.get(
-                "parameters", {}
-            ).get("standbyDisplayBrightness", None
-            )
-            self._param_actionAfterError = data.get("parameters", {}).get(
-                "actionAfterError", None
-            )
-            self._param_powerRegulatorActiveTime = data.get("parameters", {}).get(
-                "powerRegulatorActiveTime", None
-            )
-            self._param_sizeOfLoad = data.get("parameters", {}).get(
-                "sizeOfLoad", None
-            )
-            self._param_disableButtons = data.get("parameters", {}).get(
-                "disableButtons", None
-            )
-
-            self._owd_openWindowDetection = data.get("parameters", {}).get(
-                "OWD", {}
-            ).get("openWindowDetection", None)
-            self._owd_activeNow = data.get("parameters", {}).get("OWD", {}).get(
-                "activeNow", None
-            )
-            self._net_ssid = data.get("network", {}).get("SSID", None)
-            self._net_mac = data.get("network", {}).get("mac", None)
-            self._net_ipAddress = data.get("network", {}).get("ipAddress", None)
-            self._net_wifiSignalStrength = data.get("network", {}).get(
-                "wifiSignalStrength", None
-            )
-            self._net_status = data.get("network", {}).get("status", None)
-            self._hw_firmware = data.get("firmware", None)
 
             _LOGGER.debug("Status fetched from the Heatit WiFi6: %s", self.name)
         else:
@@ -258,10 +214,19 @@ class HeatitWiFi6Thermostat(ClimateEntity):
                 self.name
             )
             self._available = False
-            self._param_operatingMode = None
+            self._state["operating_mode"] = None
             self._hvac_mode = HVACMode.OFF
             self._hvac_action = HVACAction.OFF
-            self._net_status = "fail"
+            self._state["net_status"] = "fail"
+        self._build_attributes()
+        self.async_write_ha_state()
+
+    def _build_attributes(self):
+        # Expose operating_mode (raw value) and all the status fields, sensor mode/value as text
+        attrs = dict(self._state)
+        attrs["param_sensorMode"] = SENSORMODES.get(self._state["param_sensorMode"], "Unknown")
+        attrs["param_sensorValue"] = SENSORVALUES.get(self._state["param_sensorValue"], "Unknown")
+        self._attrs = attrs
 
     @property
     def unique_id(self):
@@ -297,15 +262,8 @@ class HeatitWiFi6Thermostat(ClimateEntity):
 
     @property
     def target_temperature(self):
-        match self._param_operatingMode:
-            case 1:
-                return self._param_heatingSetpoint
-            case 2:
-                return self._param_coolingSetpoint
-            case 3:
-                return self._param_ecoSetpoint
-            case _:
-                return None
+        field = _MODE_TO_SETPOINT_FIELD.get(self._state["operating_mode"])
+        return self._state[field] if field else None
 
     @property
     def hvac_mode(self):
@@ -344,47 +302,8 @@ class HeatitWiFi6Thermostat(ClimateEntity):
 
     @property
     def extra_state_attributes(self):
-        # Expose operating_mode (raw value) and all the previous attributes
-        attrs = {
-            "operating_mode": self._param_operatingMode,
-            "info_currentPower": self._info_currentPower,
-            "info_totalConsumption": self._info_totalConsumption,
-            "info_internalTemperature": self._info_internalTemperature,
-            "info_externalTemperature": self._info_externalTemperature,
-            "info_floorTemperature": self._info_floorTemperature,
-            "param_sensorMode": SENSORMODES.get(self._param_sensorMode, "Unknown"),
-            "param_sensorValue": SENSORVALUES.get(self._param_sensorValue, "Unknown"),
-            "param_heatingSetpoint": self._param_heatingSetpoint,
-            "param_coolingSetpoint": self._param_coolingSetpoint,
-            "param_ecoSetpoint": self._param_ecoSetpoint,
-            "param_internalMinimumTemperatureLimit": self._param_internalMinimumTemperatureLimit,
-            "param_internalMaximumTemperatureLimit": self._param_internalMaximumTemperatureLimit,
-            "param_floorMinimumTemperatureLimit": self._param_floorMinimumTemperatureLimit,
-            "param_floorMaximumTemperatureLimit": self._param_floorMaximumTemperatureLimit,
-            "param_externalMinimumTemperatureLimit": self._param_externalMinimumTemperatureLimit,
-            "param_externalMaximumTemperatureLimit": self._param_externalMaximumTemperatureLimit,
-            "param_internalCalibration": self._param_internalCalibration,
-            "param_floorCalibration": self._param_floorCalibration,
-            "param_externalCalibration": self._param_externalCalibration,
-            "param_regulationMode": self._param_regulationMode,
-            "param_temperatureControlHysteresis": self._param_temperatureControlHysteresis,
-            "param_temperatureDisplay": self._param_temperatureDisplay,
-            "param_activeDisplayBrightness": self._param_activeDisplayBrightness,
-            "param_standbyDisplayBrightness": self._param_standbyDisplayBrightness,
-            "param_actionAfterError": self._param_actionAfterError,
-            "param_powerRegulatorActiveTime": self._param_powerRegulatorActiveTime,
-            "param_sizeOfLoad": self._param_sizeOfLoad,
-            "param_disableButtons": self._param_disableButtons,
-            "owd_openWindowDetection": self._owd_openWindowDetection,
-            "owd_activeNow": self._owd_activeNow,
-            "net_ssid": self._net_ssid,
-            "net_mac": self._net_mac,
-            "net_ipAddress": self._net_ipAddress,
-            "net_wifiSignalStrength": self._net_wifiSignalStrength,
-            "net_status": self._net_status,
-            "hw_firmware": self._hw_firmware,
-        }
-        return attrs
+        # Built by _build_attributes() whenever _state changes.
+        return self._attrs
 
     @property
     def available(self) -> bool:
@@ -398,8 +317,7 @@ class HeatitWiFi6Thermostat(ClimateEntity):
                 "async_set_temperature(): The device %s is switched off. Target temperature can changed only when device is on.",
                 self._name,
             )
-            await self.async_update()
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()  # revert the target temperature shown in the UI
             self.hass.components.persistent_notification.create(
                 "Target temperature can changed only when Heatit WiFi6 device is ON.",
                 title="Heatif WiFi6 Thermostat",
@@ -411,92 +329,86 @@ class HeatitWiFi6Thermostat(ClimateEntity):
                 "async_set_temperature(): A new target temperature not set/known. Change target value aborted."
             )
             return
+        param = _MODE_TO_SETPOINT_PARAM.get(self._state["operating_mode"])
+        if param is None:
+            return
         self._set_temperature_pending = True
-        match self._param_operatingMode:
-            case 1:
-                param = "heatingSetpoint"
-            case 2:
-                param = "coolingSetpoint"
-            case 3:
-                param = "ecoSetpoint"
-            case _:
-                return
-        if await self._api.set_parameter(param, temperature):
-            setattr(self, param, temperature)
-            self._set_temperature_pending = False
-            await self.async_update()
-        self._set_temperature_pending = False  # also here, if set_parameter() fails.
+        try:
+            if await self._api.set_parameter(param, temperature):
+                # The device accepted the value, show it right away instead of polling it back.
+                self._state[f"param_{param}"] = temperature
+                self._build_attributes()
+                self.async_write_ha_state()
+        finally:
+            self._set_temperature_pending = False  # also if set_parameter() fails or is cancelled.
 
     async def async_set_preset_mode(self, preset_mode):
         # Eco: operatingMode=3, None (normal): operatingMode=1
         if preset_mode == PRESET_ECO:
-            await self._api.set_parameter("operatingMode", 3)
+            operating_mode = 3
         elif preset_mode == PRESET_NONE or preset_mode is None:
-            await self._api.set_parameter("operatingMode", 1)
+            operating_mode = 1
         else:
             _LOGGER.warning(
                 "async_set_preset_mode(): Unsupported preset_mode: %s", str(preset_mode)
             )
-        await self.async_update()
+            return
+        if await self._api.set_parameter("operatingMode", operating_mode):
+            self._apply_operating_mode(operating_mode)
 
     async def async_set_hvac_mode(self, hvac_mode, force=False):
         if not force and hvac_mode not in self.hvac_modes:
             _LOGGER.error("async_set_hvac_mode(): unsupported HVACMode: %s", str(hvac_mode))
             return
-        if await self._api.set_parameter(
-            "operatingMode", await self._hvac_mode_to_heatit_operatingmode(hvac_mode)
-        ):
-            await self.async_update()
-
-    async def _hvac_mode_to_heatit_operatingmode(self, mode):
-        match mode:
-            case HVACMode.OFF:
-                return 0
-            case HVACMode.HEAT:
-                return 1
-            case HVACMode.COOL:
-                return 2
-            case _:
-                _LOGGER.error(
-                    "_hvac_mode_to_heatit_operatingmode(): Unsupported mode requested from Home Assistant to Heatit: %s",
-                    str(mode),
-                )
-                return -1
-
-    async def _heatit_operatingmode_to_hvac_mode(self, operatingmode):
-        # 0 = Off, 1 = Heat, 2 = Cool, 3 = Eco (Heat but using Eco setpoint)
-        match operatingmode:
-            case 0:
-                return HVACMode.OFF
-            case 1:
-                return HVACMode.HEAT
-            case 2:
-                return HVACMode.COOL
-            case 3:
-                return HVACMode.HEAT
-            case _:
-                _LOGGER.error(
-                    "_heatit_operatingmode_to_hvac_mode(): Unknown state from Heatit: %s",
-                    str(operatingmode),
-                )
-                return None
-
-    async def _heatit_state_to_hvac_action(self, state):
-        match state:
-            case "Idle":
-                return (
-                    HVACAction.OFF
-                    if self._hvac_mode == HVACMode.OFF
-                    else HVACAction.IDLE
-                )
-            case "Heating":
-                return HVACAction.HEATING
-            case "Cooling":
-                return HVACAction.COOLING
-            case _:
-                _LOGGER.error(
-                    "_heatit_state_to_hvac_action(): Unknown operation mode from Heatit: %s",
-                    str(state),
-                )
-                return None
+        operating_mode = self._hvac_mode_to_heatit_operatingmode(hvac_mode)
+        if await self._api.set_parameter("operatingMode", operating_mode):
+            self._apply_operating_mode(operating_mode)
+
+    @callback
+    def _apply_operating_mode(self, operating_mode):
+        # The device accepted the new operatingMode: show it right away and confirm with a background refresh.
+        self._state["operating_mode"] = operating_mode
+        self._preset_mode = PRESET_ECO if operating_mode == 3 else PRESET_NONE
+        self._hvac_mode = self._heatit_operatingmode_to_hvac_mode(operating_mode)
+        if self._hvac_mode == HVACMode.OFF:
+            self._hvac_action = HVACAction.OFF
+        self._build_attributes()
+        self.async_write_ha_state()
+        self.hass.async_create_task(self.coordinator.async_request_refresh(), eager_start=True)
+
+    @callback
+    def _hvac_mode_to_heatit_operatingmode(self, mode):
+        operatingmode = _HVAC_TO_OP.get(mode)
+        if operatingmode is None:
+            _LOGGER.error(
+                "_hvac_mode_to_heatit_operatingmode(): Unsupported mode requested from Home Assistant to Heatit: %s",
+                str(mode),
+            )
+            return -1
+        return operatingmode
 
+    @callback
+    def _heatit_operatingmode_to_hvac_mode(self, operatingmode):
+        hvac_mode = _OP_TO_HVAC.get(operatingmode)
+        if hvac_mode is None:
+            _LOGGER.error(
+                "_heatit_operatingmode_to_hvac_mode(): Unknown state from Heatit: %s",
+                str(operatingmode),
+            )
+        return hvac_mode
+
+    @callback
+    def _heatit_state_to_hvac_action(self, state):
+        if state == "Idle":
+            return (
+                HVACAction.OFF
+                if self._hvac_mode == HVACMode.OFF
+                else HVACAction.IDLE
+            )
+        hvac_action = _STATE_TO_ACTION.get(state)
+        if hvac_action is None:
+            _LOGGER.error(
+                "_heatit_state_to_hvac_action(): Unknown operation mode from Heatit: %s",
+                str(state),
+            )
+        return hvac_action
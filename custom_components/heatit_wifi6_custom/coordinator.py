@@ -0,0 +1,30 @@
+import logging
+from datetime import timedelta
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from .const import DOMAIN, POLL_INTERVAL
+from .api import HeatitWiFi6API
+
+_LOGGER = logging.getLogger(__name__)
+
+class HeatitWiFi6Coordinator(DataUpdateCoordinator):
+    """Poll the status of one Heatit WiFi6 device for all of its entities."""
+
+    def __init__(self, hass: HomeAssistant, api: HeatitWiFi6API, name: str):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {name}",
+            update_interval=timedelta(minutes=POLL_INTERVAL),
+        )
+        self.api = api
+
+    async def _async_update_data(self) -> dict:
+        write_count = self.api.write_count
+        data = await self.api.get_status(retries=1, timeout=5)
+        if data and write_count != self.api.write_count:
+            # A parameter was written while the status was fetched, the status may miss the new value.
+            data = await self.api.get_status(retries=1, timeout=5)
+        if not data:
+            raise UpdateFailed("Status fetch failed. Device may be slow to respond or temporarily offline.")
+        return data